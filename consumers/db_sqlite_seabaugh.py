@@ -30,6 +30,13 @@ import sqlite3
 import utils.utils_config as config
 from utils.utils_logger import logger
 
+# Parameterized INSERT statement, defined once and reused for every message
+INSERT_SQL = """
+    INSERT INTO streamed_messages (
+        message, author, timestamp, category, sentiment, keyword_mentioned, message_length
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
 #####################################
 # Define Function to Initialize SQLite Database
 #####################################
@@ -98,11 +105,7 @@ def insert_message(message: dict, db_path: pathlib.Path) -> None:
         with sqlite3.connect(STR_PATH) as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO streamed_messages (
-                    message, author, timestamp, category, sentiment, keyword_mentioned, message_length
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+                INSERT_SQL,
                 (
                     message["message"],
                     message["author"],
@@ -15,23 +15,35 @@ Enhancements:
 #####################################
 
 # import from standard library
-import json
+import collections
+import itertools
+import math
+import multiprocessing
+import operator
 import os
 import pathlib
+import queue
+import signal
+import sqlite3
 import sys
+import threading
+import time
 
 # import external modules
-from kafka import KafkaConsumer
+import orjson
+from kafka import ConsumerRebalanceListener, KafkaConsumer
+from kafka.structs import OffsetAndMetadata
+
+# Ensure the parent directory is in sys.path when run as a script
+if __name__ == "__main__":
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # import from local modules
 import utils.utils_config as config
-from utils.utils_consumer import create_kafka_consumer
+from utils.utils_consumer import create_kafka_consumer, get_topic_partition_count
 from utils.utils_logger import logger
 from utils.utils_producer import verify_services, is_topic_available
 
-# Ensure the parent directory is in sys.path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 # Define keyword to category mapping
 KEYWORD_CATEGORIES = {
     "meme": "humor",
@@ -43,35 +55,83 @@ KEYWORD_CATEGORIES = {
     "game": "gaming",
 }
 
-#####################################
-# Function to Categorize Sentiment
-#####################################
-
-
-def categorize_sentiment(sentiment_score: float) -> str:
-    """
-    Categorize the sentiment based on the sentiment score.
-
-    Args:
-        sentiment_score (float): The sentiment score.
-
-    Returns:
-        str: The sentiment category ('positive', 'negative', or 'neutral').
-    """
-    if sentiment_score > 0.1:
-        return "positive"
-    elif sentiment_score < -0.1:
-        return "negative"
-    else:
-        return "neutral"
-
+# Bound methods used on the per-message path, saving an attribute lookup per call
+_cat_get = KEYWORD_CATEGORIES.get
+_logger_info = logger.info
+_logger_warn = logger.warning
+
+# Sentiment categories, indexed in process_message by
+# (score > 0.1) + (not score < -0.1): negative below -0.1, positive above 0.1,
+# neutral otherwise (including NaN)
+_SENT = ("negative", "neutral", "positive")
+
+# Extract the raw fields of an incoming message in one call
+_get_message_fields = operator.itemgetter(
+    "message",
+    "author",
+    "timestamp",
+    "sentiment",
+    "keyword_mentioned",
+    "message_length",
+)
+
+# Column order used when writing processed messages to the messages table
+MESSAGE_COLUMNS = (
+    "message",
+    "author",
+    "timestamp",
+    "category",
+    "sentiment",
+    "sentiment_category",
+    "keyword_mentioned",
+    "message_length",
+)
+
+# Processed message; fields follow MESSAGE_COLUMNS so each instance is an INSERT row
+ProcessedMsg = collections.namedtuple("ProcessedMsg", MESSAGE_COLUMNS)
+
+# Parameterized INSERT statement, built once from MESSAGE_COLUMNS
+INSERT_SQL = (
+    f"INSERT INTO messages ({', '.join(MESSAGE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in MESSAGE_COLUMNS)})"
+)
+
+# Per-connection PRAGMAs for write throughput (journal_mode=WAL persists in the file)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-65536;",
+    "PRAGMA mmap_size=268435456;",
+)
+
+# Secondary indexes, built after ingest so inserts skip index maintenance
+INDEX_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS idx_category ON messages(category);",
+    "CREATE INDEX IF NOT EXISTS idx_sentiment_category ON messages(sentiment_category);",
+)
+
+# Flush buffered messages once this many are collected, or once the oldest
+# buffered record has waited this many seconds (bounds latency when idle)
+BATCH_SIZE = 500
+BATCH_TIMEOUT_SECS = 5.0
+
+# Log a category alert (or unknown-keyword warning) for only every Nth such message
+ALERT_LOG_EVERY = 100
+_alert_counter = itertools.count(1)
+_unknown_keyword_counter = itertools.count(1)
+
+# Maximum time a single consumer.poll() call waits for records
+POLL_TIMEOUT_MS = 500
+
+# Maximum number of batches waiting for the database writer thread
+WRITE_QUEUE_MAXSIZE = 8
 
 #####################################
 # Function to Process a Single Message
 #####################################
 
 
-def process_message(message: dict) -> dict:
+def process_message(message: dict) -> ProcessedMsg:
     """
     Process and transform a single JSON message.
     Determines category based on keyword_mentioned using KEYWORD_CATEGORIES.
@@ -81,42 +141,70 @@ def process_message(message: dict) -> dict:
         message (dict): The JSON message as a Python dictionary.
 
     Returns:
-        dict: Processed message with determined category and sentiment category.
+        ProcessedMsg: Processed message with determined category and sentiment category.
     """
-    logger.info("Called process_message() with:")
-    logger.info(f"   {message=}")
     processed_message = None
     try:
-        keyword_mentioned = message.get("keyword_mentioned")
-        category = KEYWORD_CATEGORIES.get(keyword_mentioned, "unknown")
-        sentiment_score = float(message.get("sentiment", 0.0))
-        sentiment_category = categorize_sentiment(sentiment_score)
+        (
+            text,
+            author,
+            timestamp,
+            sentiment,
+            keyword_mentioned,
+            message_length,
+        ) = _get_message_fields(message)
+        category = _cat_get(keyword_mentioned, "unknown")
+        sentiment_score = float(sentiment)
+        sentiment_category = _SENT[(sentiment_score > 0.1) + (not sentiment_score < -0.1)]
 
         # Log alerts based on keyword and category detection
         if keyword_mentioned:
             if category != "unknown":
-                logger.info(f"Alert: Detected category '{category}' for keyword '{keyword_mentioned}'")
-            else:
-                logger.warning(f"Keyword '{keyword_mentioned}' not found in categories")
+                if next(_alert_counter) % ALERT_LOG_EVERY == 0:
+                    _logger_info(
+                        "Alert: Detected category '{}' for keyword '{}'",
+                        category,
+                        keyword_mentioned,
+                    )
+            elif next(_unknown_keyword_counter) % ALERT_LOG_EVERY == 0:
+                _logger_warn("Keyword '{}' not found in categories", keyword_mentioned)
         else:
-            logger.warning("No keyword mentioned in message")
-
-        processed_message = {
-            "message": message.get("message"),
-            "author": message.get("author"),
-            "timestamp": message.get("timestamp"),
-            "category": category,
-            "sentiment": sentiment_score,
-            "sentiment_category": sentiment_category,
-            "keyword_mentioned": keyword_mentioned,
-            "message_length": int(message.get("message_length", 0)),
-        }
-        logger.info(f"Processed message: {processed_message}")
+            _logger_warn("No keyword mentioned in message")
+
+        processed_message = ProcessedMsg(
+            text,
+            author,
+            timestamp,
+            category,
+            sentiment_score,
+            sentiment_category,
+            keyword_mentioned,
+            int(message_length),
+        )
     except Exception as e:
         logger.error(f"Error processing message: {e}")
     return processed_message
 
 
+#####################################
+# Function to Process a Batch of Messages
+#####################################
+
+
+def process_messages_batch(messages) -> list:
+    """
+    Process a batch of JSON messages in a single pass.
+    Messages that fail processing are dropped.
+
+    Args:
+        messages (iterable): The JSON messages as Python dictionaries.
+
+    Returns:
+        list: Processed messages ready to insert.
+    """
+    return [m for m in map(process_message, messages) if m]
+
+
 #####################################
 # Initialize SQLite Database
 #####################################
@@ -125,17 +213,17 @@ def process_message(message: dict) -> dict:
 def init_db(sql_path: pathlib.Path):
     """
     Initialize the SQLite database with a table to store messages.
+    The table is created without secondary indexes; see build_indexes().
 
     Args:
         sql_path (pathlib.Path): Path to the SQLite database file.
     """
-    import sqlite3
-
     conn = sqlite3.connect(sql_path)
+    conn.execute("PRAGMA journal_mode=WAL;")
     cursor = conn.cursor()
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS messages (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER PRIMARY KEY,
             message TEXT,
             author TEXT,
             timestamp TEXT,
@@ -151,38 +239,175 @@ def init_db(sql_path: pathlib.Path):
 
 
 #####################################
-# Insert Processed Message into SQLite
+# Build Secondary Indexes After Ingest
+#####################################
+
+
+def build_indexes(conn: sqlite3.Connection):
+    """
+    Create the secondary indexes on the messages table.
+    Call this after ingest (at shutdown or on demand), not before,
+    so the hot insert loop does not pay for index updates.
+
+    Args:
+        conn (sqlite3.Connection): Open connection to the database.
+    """
+    with conn:
+        for statement in INDEX_STATEMENTS:
+            conn.execute(statement)
+
+
+#####################################
+# Open a Long-Lived SQLite Connection
 #####################################
 
 
-def insert_message(message: dict, sql_path: pathlib.Path):
+def connect_db(sql_path: pathlib.Path):
     """
-    Insert a processed message into the SQLite database.
+    Open a SQLite connection to be reused for the life of the consumer
+    and apply the per-connection CONNECTION_PRAGMAS.
 
     Args:
-        message (dict): The processed message.
         sql_path (pathlib.Path): Path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: Open connection to the database.
     """
-    import sqlite3
+    # Room for INSERT_SQL and the PRAGMAs in the per-connection statement cache.
+    # Worker processes share the file, so wait on the write lock instead of failing.
+    conn = sqlite3.connect(sql_path, timeout=30.0, cached_statements=256)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
-    conn = sqlite3.connect(sql_path)
-    cursor = conn.cursor()
-    cursor.execute('''
-        INSERT INTO messages (
-            message, author, timestamp, category, sentiment, sentiment_category, keyword_mentioned, message_length
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        message["message"],
-        message["author"],
-        message["timestamp"],
-        message["category"],
-        message["sentiment"],
-        message["sentiment_category"],
-        message["keyword_mentioned"],
-        message["message_length"],
-    ))
-    conn.commit()
-    conn.close()
+
+#####################################
+# Insert a Batch of Processed Messages into SQLite
+#####################################
+
+
+def insert_messages_batch(messages: list, conn):
+    """
+    Insert a batch of processed messages into the SQLite database
+    using a single transaction.
+
+    Args:
+        messages (list): The processed messages (ProcessedMsg rows).
+        conn (sqlite3.Connection): Open connection to the database.
+    """
+    if not messages:
+        return
+
+    with conn:
+        # ProcessedMsg instances are already row tuples in column order
+        conn.executemany(INSERT_SQL, messages)
+
+
+#####################################
+# Write Batches to SQLite on a Background Thread
+#####################################
+
+
+def db_writer(batches: queue.Queue, written: queue.Queue, sql_path: pathlib.Path):
+    """
+    Insert queued batches into SQLite until a None sentinel is received.
+    The connection is opened and used only on this thread.
+
+    After each batch is committed, its Kafka offsets are put on `written`
+    so the polling thread can commit them. If an insert fails, the error
+    is put on `written` instead and later batches are discarded.
+
+    Calls batches.task_done() for every item so callers can wait with
+    batches.join().
+
+    Args:
+        batches (queue.Queue): (messages, offsets) tuples, or None to stop.
+        written (queue.Queue): Offsets of committed batches, or an exception.
+        sql_path (pathlib.Path): Path to the SQLite database file.
+    """
+    conn = None
+    failed = False
+    try:
+        conn = connect_db(sql_path)
+    except Exception as e:
+        logger.error(f"ERROR: Could not connect to database: {e}")
+        written.put(e)
+        failed = True
+
+    try:
+        while True:
+            item = batches.get()
+            try:
+                if item is None:
+                    break
+                if failed:
+                    continue
+                messages, offsets = item
+                try:
+                    insert_messages_batch(messages, conn)
+                    logger.info(f"Inserted batch of {len(messages)} messages.")
+                    written.put(offsets)
+                except Exception as e:
+                    logger.error(f"ERROR: Could not insert batch into database: {e}")
+                    written.put(e)
+                    failed = True
+            finally:
+                # Lets batches.join() wait until every queued batch is handled
+                batches.task_done()
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def commit_written_offsets(consumer: KafkaConsumer, written: queue.Queue, sync=False):
+    """
+    Commit the Kafka offsets of every batch the writer thread has stored.
+
+    Args:
+        consumer (KafkaConsumer): The consumer that polled the batches.
+        written (queue.Queue): Offsets (or an exception) from db_writer.
+        sync (bool): Commit synchronously, e.g. on shutdown.
+
+    Raises:
+        Exception: The database error reported by the writer thread.
+    """
+    offsets = {}
+    while True:
+        try:
+            item = written.get_nowait()
+        except queue.Empty:
+            break
+        if isinstance(item, Exception):
+            raise item
+        offsets.update(item)
+    if offsets:
+        if sync:
+            consumer.commit(offsets)
+        else:
+            consumer.commit_async(offsets)
+
+
+#####################################
+# Flush Pending Work Before a Rebalance
+#####################################
+
+
+class FlushOnRevokeListener(ConsumerRebalanceListener):
+    """
+    Rebalance listener that runs `on_revoke` before partitions are taken away,
+    so a worker stores and commits everything it polled while it still owns
+    the partitions. Set `on_revoke` once the write pipeline is running.
+    """
+
+    def __init__(self):
+        self.on_revoke = None
+
+    def on_partitions_revoked(self, revoked):
+        if self.on_revoke is not None:
+            self.on_revoke(revoked)
+
+    def on_partitions_assigned(self, assigned):
+        logger.info(f"Assigned partitions: {sorted(tp.partition for tp in assigned)}")
 
 
 #####################################
@@ -196,10 +421,12 @@ def consume_messages_from_kafka(
     group: str,
     sql_path: pathlib.Path,
     interval_secs: int,
+    stop_event=None,
 ):
     """
     Consume new messages from Kafka topic and process them.
     Each message is expected to be JSON-formatted.
+    Runs until interrupted or until stop_event is set.
 
     Args:
     - topic (str): Kafka topic to consume messages from.
@@ -207,6 +434,8 @@ def consume_messages_from_kafka(
     - group (str): Consumer group ID for Kafka.
     - sql_path (pathlib.Path): Path to the SQLite database file.
     - interval_secs (int): Interval between reads from the file.
+    - stop_event (optional): Object with is_set(), e.g. multiprocessing.Event,
+      that requests shutdown.
     """
     logger.info("Called consume_messages_from_kafka() with:")
     logger.info(f"   {topic=}")
@@ -223,11 +452,16 @@ def consume_messages_from_kafka(
         sys.exit(11)
 
     logger.info("Step 2. Create a Kafka consumer.")
+    listener = FlushOnRevokeListener()
     try:
         consumer: KafkaConsumer = create_kafka_consumer(
             topic,
             group,
-            value_deserializer_provided=lambda x: json.loads(x.decode("utf-8")),
+            # orjson parses the raw bytes directly, no separate UTF-8 decode
+            value_deserializer_provided=orjson.loads,
+            enable_auto_commit=False,
+            max_poll_records=BATCH_SIZE,
+            rebalance_listener=listener,
         )
     except Exception as e:
         logger.error(f"ERROR: Could not create Kafka consumer: {e}")
@@ -250,14 +484,152 @@ def consume_messages_from_kafka(
         logger.error("ERROR: Consumer is None. Exiting.")
         sys.exit(13)
 
+    batches = queue.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+    written = queue.Queue()
+    writer = threading.Thread(
+        target=db_writer, args=(batches, written, sql_path), name="db_writer"
+    )
+    writer.start()
+
+    buffer = []
+    offsets = {}
+    # When the oldest unflushed record was polled; None while nothing is pending
+    pending_since = None
+    # Error raised inside the rebalance listener, which kafka-python only logs
+    revoke_error = None
+
+    def flush_before_revoke(revoked):
+        """Store and commit all pending work before partitions are revoked."""
+        nonlocal buffer, offsets, pending_since, revoke_error
+        if not writer.is_alive():
+            return
+        try:
+            if offsets:
+                batches.put((buffer, offsets))
+                buffer = []
+                offsets = {}
+                pending_since = None
+            batches.join()
+            commit_written_offsets(consumer, written, sync=True)
+        except Exception as e:
+            logger.error(f"ERROR: Could not commit before rebalance: {e}")
+            revoke_error = e
+
+    listener.on_revoke = flush_before_revoke
+
     try:
-        for message in consumer:
-            processed_message = process_message(message.value)
-            if processed_message:
-                insert_message(processed_message, sql_path)
+        while stop_event is None or not stop_event.is_set():
+            # Never wait in poll() past the pending batch's flush deadline
+            timeout_ms = POLL_TIMEOUT_MS
+            if pending_since is not None:
+                remaining_secs = pending_since + BATCH_TIMEOUT_SECS - time.monotonic()
+                timeout_ms = max(0, min(POLL_TIMEOUT_MS, math.ceil(remaining_secs * 1000)))
+            records = consumer.poll(timeout_ms=timeout_ms, max_records=BATCH_SIZE)
+            if revoke_error is not None:
+                raise revoke_error
+            if records and pending_since is None:
+                pending_since = time.monotonic()
+            for tp, partition_messages in records.items():
+                buffer.extend(
+                    process_messages_batch(m.value for m in partition_messages)
+                )
+                offsets[tp] = OffsetAndMetadata(partition_messages[-1].offset + 1, None)
+            # Flush when full, or when the oldest pending record reaches the timeout
+            if len(buffer) >= BATCH_SIZE or (
+                pending_since is not None
+                and time.monotonic() - pending_since >= BATCH_TIMEOUT_SECS
+            ):
+                batches.put((buffer, offsets))
+                buffer = []
+                offsets = {}
+                pending_since = None
+            # Offsets are committed only after their batch is durable in SQLite
+            commit_written_offsets(consumer, written)
     except Exception as e:
         logger.error(f"ERROR: Could not consume messages from Kafka: {e}")
         raise
+    finally:
+        if offsets:
+            batches.put((buffer, offsets))
+        batches.put(None)
+        writer.join()
+        try:
+            commit_written_offsets(consumer, written, sync=True)
+        except Exception as e:
+            logger.error(f"ERROR: Could not commit final offsets: {e}")
+        # Leave the group now so our partitions are reassigned without waiting
+        # for the session timeout
+        listener.on_revoke = None
+        consumer.close()
+
+
+#####################################
+# Run a Consumer Worker Process
+#####################################
+
+
+class WorkerStopFlag:
+    """
+    Stop check for a worker: true once the shared stop_event is set or the
+    worker itself received SIGTERM/SIGINT. The signal handler only flips a
+    plain attribute, so it never blocks on the event's internal lock.
+    """
+
+    def __init__(self, stop_event):
+        self.stop_event = stop_event
+        self.requested = False
+
+    def request_stop(self, signum, frame):
+        self.requested = True
+
+    def is_set(self) -> bool:
+        return self.requested or self.stop_event.is_set()
+
+
+def run_consumer_worker(
+    topic: str,
+    kafka_url: str,
+    group: str,
+    sql_path: pathlib.Path,
+    interval_secs: int,
+    stop_event,
+):
+    """
+    Entry point for a worker process.
+    Workers share a consumer group, so Kafka assigns each its own partitions.
+    SIGTERM and SIGINT end the poll loop after the current iteration, so the
+    worker flushes its batch and commits offsets before exiting.
+
+    Args:
+    - topic (str): Kafka topic to consume messages from.
+    - kafka_url (str): Kafka broker address.
+    - group (str): Consumer group ID for Kafka.
+    - sql_path (pathlib.Path): Path to the SQLite database file.
+    - interval_secs (int): Interval between reads from the file.
+    - stop_event (multiprocessing.Event): Set to request shutdown.
+    """
+    stop_flag = WorkerStopFlag(stop_event)
+    signal.signal(signal.SIGTERM, stop_flag.request_stop)
+    signal.signal(signal.SIGINT, stop_flag.request_stop)
+    try:
+        consume_messages_from_kafka(
+            topic, kafka_url, group, sql_path, interval_secs, stop_flag
+        )
+    except KeyboardInterrupt:
+        logger.warning("Consumer worker interrupted by user.")
+
+
+#####################################
+# Handle SIGTERM in the Main Process
+#####################################
+
+
+def handle_sigterm(signum, frame):
+    """
+    Turn SIGTERM (sent by timeout, docker stop, systemd) into KeyboardInterrupt
+    so main() stops the workers and builds indexes in its finally block.
+    """
+    raise KeyboardInterrupt
 
 
 #####################################
@@ -286,34 +658,81 @@ def main():
         logger.error(f"ERROR: Failed to read environment variables: {e}")
         sys.exit(1)
 
-    logger.info("STEP 2. Delete any prior database file for a fresh start.")
-    if sqlite_path.exists():
-        try:
-            sqlite_path.unlink()
-            logger.info("SUCCESS: Deleted database file.")
-        except Exception as e:
-            logger.error(f"ERROR: Failed to delete DB file: {e}")
-            sys.exit(2)
-
-    logger.info("STEP 3. Initialize a new database with an empty table.")
+    logger.info("STEP 2. Initialize a new database with an empty table in a staging file.")
+    staging_path = sqlite_path.with_name(sqlite_path.name + ".new")
     try:
-        init_db(sqlite_path)
+        # A crashed prior init_db can leave the staging file and its WAL/SHM files
+        for path in (
+            staging_path,
+            pathlib.Path(f"{staging_path}-wal"),
+            pathlib.Path(f"{staging_path}-shm"),
+        ):
+            path.unlink(missing_ok=True)
+        init_db(staging_path)
     except Exception as e:
         logger.error(f"ERROR: Failed to create db table: {e}")
         sys.exit(3)
 
-    logger.info("STEP 4. Begin consuming and storing messages.")
+    logger.info("STEP 3. Atomically replace any prior database file for a fresh start.")
     try:
-        consume_messages_from_kafka(
-            topic, kafka_url, group_id, sqlite_path, interval_secs
+        # WAL/SHM files left by a prior run must not be paired with the new file
+        for suffix in ("-wal", "-shm"):
+            pathlib.Path(f"{sqlite_path}{suffix}").unlink(missing_ok=True)
+        os.replace(staging_path, sqlite_path)
+        logger.info("SUCCESS: Replaced database file.")
+    except Exception as e:
+        logger.error(f"ERROR: Failed to replace DB file: {e}")
+        sys.exit(2)
+
+    logger.info("STEP 4. Begin consuming and storing messages.")
+    num_workers = get_topic_partition_count(topic)
+    logger.info(f"Starting {num_workers} consumer worker(s), one per partition.")
+    stop_event = multiprocessing.Event()
+    workers = [
+        multiprocessing.Process(
+            target=run_consumer_worker,
+            args=(topic, kafka_url, group_id, sqlite_path, interval_secs, stop_event),
+            name=f"consumer-{i}",
         )
+        for i in range(num_workers)
+    ]
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    try:
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
     except KeyboardInterrupt:
-        logger.warning("Consumer interrupted by user.")
+        logger.warning("Consumer interrupted by user or SIGTERM.")
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
     finally:
+        # Let shutdown finish; a repeated signal must not abort the cleanup
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        stop_event.set()
+        for worker in workers:
+            if worker.is_alive():
+                worker.join()
+        logger.info("Building indexes after ingest.")
+        try:
+            conn = connect_db(sqlite_path)
+            try:
+                build_indexes(conn)
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"ERROR: Failed to build indexes: {e}")
         logger.info("Consumer shutting down.")
 
+    # Workers report setup failures (e.g. sys.exit(11) or sys.exit(13)) via exit codes
+    failed_workers = [w for w in workers if w.exitcode not in (0, None)]
+    for worker in failed_workers:
+        logger.error(f"ERROR: Worker {worker.name} exited with code {worker.exitcode}.")
+    if failed_workers:
+        exit_code = failed_workers[0].exitcode
+        sys.exit(exit_code if exit_code > 0 else 1)
+
 
 #####################################
 # Conditional Execution
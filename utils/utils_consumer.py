@@ -26,6 +26,14 @@ def create_kafka_consumer(
     topic_provided: str = None,
     group_id_provided: str = None,
     value_deserializer_provided=None,
+    enable_auto_commit: bool = True,
+    max_poll_records: int = 500,
+    fetch_min_bytes: int = 1 << 16,
+    fetch_max_wait_ms: int = 500,
+    fetch_max_bytes: int = 52428800,
+    max_partition_fetch_bytes: int = 10485760,
+    receive_buffer_bytes: int = 1 << 20,
+    rebalance_listener=None,
 ):
     """
     Create and return a Kafka consumer instance.
@@ -34,6 +42,14 @@ def create_kafka_consumer(
         topic_provided (str): The Kafka topic to subscribe to. Defaults to the environment variable or default.
         group_id_provided (str): The consumer group ID. Defaults to the environment variable or default.
         value_deserializer_provided (callable, optional): Function to deserialize message values.
+        enable_auto_commit (bool): Whether Kafka commits offsets automatically. Pass False to commit manually.
+        max_poll_records (int): Maximum records returned by a single poll().
+        fetch_min_bytes (int): Minimum data the broker should return for a fetch request.
+        fetch_max_wait_ms (int): Maximum time the broker waits to reach fetch_min_bytes.
+        fetch_max_bytes (int): Maximum data the broker returns for a fetch request.
+        max_partition_fetch_bytes (int): Maximum data per partition the broker returns.
+        receive_buffer_bytes (int): Size of the TCP receive buffer (SO_RCVBUF).
+        rebalance_listener (ConsumerRebalanceListener, optional): Notified when partitions are revoked or assigned.
 
     Returns:
         KafkaConsumer: Configured Kafka consumer instance.
@@ -48,16 +64,49 @@ def create_kafka_consumer(
 
     try:
         consumer = KafkaConsumer(
-            topic,
             group_id=consumer_group_id,
             value_deserializer=value_deserializer_provided
             or (lambda x: x.decode("utf-8")),
             bootstrap_servers=kafka_broker,
             auto_offset_reset="earliest",
-            enable_auto_commit=True,
+            enable_auto_commit=enable_auto_commit,
+            max_poll_records=max_poll_records,
+            fetch_min_bytes=fetch_min_bytes,
+            fetch_max_wait_ms=fetch_max_wait_ms,
+            fetch_max_bytes=fetch_max_bytes,
+            max_partition_fetch_bytes=max_partition_fetch_bytes,
+            receive_buffer_bytes=receive_buffer_bytes,
         )
+        if topic:
+            consumer.subscribe(topics=[topic], listener=rebalance_listener)
         logger.info("Kafka consumer created successfully.")
         return consumer
     except Exception as e:
         logger.error(f"Error creating Kafka consumer: {e}")
         raise
+
+
+def get_topic_partition_count(topic_provided: str) -> int:
+    """
+    Return the number of partitions for a Kafka topic.
+
+    Args:
+        topic_provided (str): The Kafka topic to inspect.
+
+    Returns:
+        int: The partition count, or 1 if it cannot be determined.
+    """
+    kafka_broker = get_kafka_broker_address()
+    consumer = None
+    try:
+        consumer = KafkaConsumer(bootstrap_servers=kafka_broker)
+        partitions = consumer.partitions_for_topic(topic_provided) or set()
+        count = max(len(partitions), 1)
+        logger.info(f"Topic '{topic_provided}' has {count} partition(s).")
+        return count
+    except Exception as e:
+        logger.error(f"Error reading partitions for topic '{topic_provided}': {e}")
+        return 1
+    finally:
+        if consumer is not None:
+            consumer.close()